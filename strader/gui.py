@@ -1,19 +1,48 @@
+import collections
+import contextlib
+import hashlib
+import queue
 import threading
+import time
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import StringVar, filedialog, messagebox, scrolledtext, ttk
 
-import matplotlib
-import matplotlib.pyplot as plt
+import numpy as np
 from bbstrader.trading.execution import MT5_ENGINE_TIMEFRAMES, Mt5ExecutionEngine
 from loguru import logger
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from strader import inputs
 from strader.strategy import SentimentTrading
 
-matplotlib.use("TkAgg")
+EXE_FILETYPES = (("Executable Files", "*.exe"), ("All Files", "*.*"))
+INI_FILETYPES = (("INI Files", "*.ini"), ("All Files", "*.*"))
+TXT_FILETYPES = (("Text Files", "*.txt"), ("All Files", "*.*"))
+
+# Ticker files longer than this are shown in a Treeview instead of the Text box
+TICKER_TREE_MIN_ROWS = 50
 
 SYMBOLS_TYPE = ["stock", "etf", "future", "forex", "crypto", "index"]
+# (entry attribute, type, default when empty, label) of the numeric inputs
+NUMERIC_INPUTS = (
+    ("daily_risk", float, 0.01, "Daily Risk (percentage)"),
+    ("max_risk", float, 10.0, "Max Risk (percentage)"),
+    ("threshold", float, 0.2, "Sentiment Threshold"),
+    ("max_positions", int, 100, "Max Positions"),
+    ("expected_return", float, 5.0, "Expected Return"),
+    ("iter_time", int, 15, "Iteration Time"),
+)
+LOG_DRAIN_INTERVAL_MS = 50
+LOG_DRAIN_BATCH_SIZE = 500
+LOG_MAX_LINES = 5000
+ENGINE_PROGRESS_INTERVAL_MS = 100
+ENGINE_JOIN_TIMEOUT = 2.0
+# Answer given to a prompt left pending when its engine is stopped, the
+# engine treats anything but Y/Yes as a rejected order
+PROMPT_CANCELLED = "N"
+# Sentiment scores are in [-1, 1], a fixed x range keeps the chart axes static
+SENTIMENT_LIMIT = 1.0
+CHART_MIN_REDRAW_INTERVAL_MS = 500
 
 
 class SentimentTradingApp(object):
@@ -24,29 +53,64 @@ class SentimentTradingApp(object):
         root.geometry("1600x900")
 
         self.trade_engine = None
+        self._engine_thread = None
+        # Engine threads that may still be running, oldest first
+        self._engine_threads = []
+        self._engine_stop = threading.Event()
+        self._engine_started = threading.Event()
+        self._engine_lock = threading.Lock()
         self.pending_prompt = None
         self._chart_update_job = None
-        self.prompt_response_ready = threading.Event()
-        self.prompt_response_value = None
-        self._last_sentiments = {}
+        self._log_drain_job = None
+        # Bounded, so a burst of records cannot pile up faster than the log
+        # area shows them, older lines would be trimmed from it anyway
+        self._log_buffer = collections.deque(maxlen=LOG_MAX_LINES)
+        self._prompt_queue = queue.Queue(maxsize=1)
+        self._last_sentiment_sig = self._sentiment_signature({})
+        self._parsed_inputs = {}
+        self._redraw_pending = False
+        self._redraw_full = False
+        self._last_redraw_ts = 0.0
+        self._chart_visible = True
+        self._init_styles()
         self.setup_layout(root)
+        self._drain_logs()
+        # Registered once, adding it per submit would duplicate every record
+        self._loguru_id = logger.add(
+            self.gui_safe_logger,
+            level="DEBUG",
+            format="{time:YYYY-MM-DD HH:mm:ss} {level} {message}",
+        )
 
     def on_close(self):
-        if self._chart_update_job is not None:
-            try:
-                self.root.after_cancel(self._chart_update_job)
-            except Exception:
-                pass
-            self._chart_update_job = None
-
-        if self.trade_engine:
-            self.trade_engine.stop()
+        for job_name in ("_chart_update_job", "_log_drain_job"):
+            job = getattr(self, job_name)
+            if job is not None:
+                try:
+                    self.root.after_cancel(job)
+                except Exception:
+                    pass
+                setattr(self, job_name, None)
+
+        self._stop_engine()
+        if self._engine_thread is not None:
+            self._engine_thread.join(timeout=ENGINE_JOIN_TIMEOUT)
+        logger.remove(self._loguru_id)
 
         # Breaks out of mainloop
         self.root.quit()
         # Fully destroys GUI
         self.root.destroy()
 
+    def _init_styles(self):
+        """Registers the label styles shared by all the input panels."""
+        self.style = ttk.Style(self.root)
+        self.style.configure("Header.TLabel", font=("Segoe UI", 30, "bold"))
+        self.style.configure("Section.TLabel", font=("Segoe UI", 10, "bold"))
+        self.style.configure("Prompt.TLabel", font=("Segoe UI", 10))
+        self.style.configure("Field.TLabel", font=("Segoe UI", 9))
+        self.style.configure("FieldBold.TLabel", font=("Segoe UI", 9, "bold"))
+
     def setup_layout(self, root: tk.Tk):
         # Columns
         root.grid_columnconfigure(0, weight=0)
@@ -73,11 +137,13 @@ class SentimentTradingApp(object):
         # Right - Charts
         self.chart_frame = ttk.Frame(root, padding=10)
         self.chart_frame.grid(row=0, column=2, rowspan=2, sticky="nsew")
+        self.chart_frame.bind("<Map>", self._on_chart_map)
+        self.chart_frame.bind("<Unmap>", self._on_chart_unmap)
 
         self.build_inputs()
         self.build_logs()
         self.build_prompt()
-        self.build_charts()
+        self.build_chart_placeholder()
 
     def build_scrollable_input_panel(self, parent):
         """
@@ -97,10 +163,29 @@ class SentimentTradingApp(object):
         scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
         self.input_frame = ttk.Frame(canvas)
 
-        # Bind scroll region
-        self.input_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Bind scroll region, coalescing the many <Configure> events fired
+        # while widgets are created into one bbox scan per idle cycle
+        self._scroll_update_pending = False
+        self._input_frame_size = None
+
+        def update_scrollregion():
+            self._scroll_update_pending = False
+            size = (
+                self.input_frame.winfo_reqwidth(),
+                self.input_frame.winfo_reqheight(),
+            )
+            if size == self._input_frame_size:
+                return
+            self._input_frame_size = size
+            canvas.configure(scrollregion=canvas.bbox("all"))
+
+        def on_frame_configure(event):
+            if self._scroll_update_pending:
+                return
+            self._scroll_update_pending = True
+            canvas.after_idle(update_scrollregion)
+
+        self.input_frame.bind("<Configure>", on_frame_configure)
 
         canvas.create_window((0, 0), window=self.input_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -109,17 +194,35 @@ class SentimentTradingApp(object):
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # Enable scrolling with mouse wheel
-        self.input_frame.bind_all(
-            "<MouseWheel>",
-            lambda event: canvas.yview_scroll(int(-1 * (event.delta / 120)), "units"),
-        )
+        # Enable scrolling with mouse wheel, only while the pointer is over
+        # the panel so wheel events elsewhere do not scroll it
+        def on_wheel(event):
+            if event.num == 4:
+                canvas.yview_scroll(-1, "units")
+            elif event.num == 5:
+                canvas.yview_scroll(1, "units")
+            else:
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+        wheel_events = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+        def bind_wheel(event):
+            for sequence in wheel_events:
+                canvas.bind_all(sequence, on_wheel)
+
+        def unbind_wheel(event):
+            for sequence in wheel_events:
+                canvas.unbind_all(sequence)
+
+        container.bind("<Enter>", bind_wheel)
+        container.bind("<Leave>", unbind_wheel)
 
     def browse_path(self):
         """Open a file dialog to select the MT5 terminal executable."""
         file_path = filedialog.askopenfilename(
+            parent=self.root,
             title="Select MT5 Terminal Executable",
-            filetypes=[("Executable Files", "*.exe"), ("All Files", "*.*")],
+            filetypes=EXE_FILETYPES,
         )
         if file_path:
             self.mt5_path.delete(0, tk.END)
@@ -129,37 +232,59 @@ class SentimentTradingApp(object):
     def load_config_from_file(self, name):
         """Load configuration from a file and populate input fields."""
         config_file_path = filedialog.askopenfilename(
+            parent=self.root,
             title=f"Select {name} File",
-            filetypes=[("INI Files", "*.ini"), ("All Files", "*.*")],
+            filetypes=INI_FILETYPES,
         )
         # If the user cancels the dialog, config_file_path will be empty
         if not config_file_path:
             self.log("Configuration loading cancelled by user.")
             return None
-        if config_file_path:
-            try:
-                config = inputs.load_config(config_file_path)
-                self.log(f"Successfully loaded {name} from {config_file_path}")
-                return config
-            except Exception as e:
-                messagebox.showerror(
-                    "Loading Error",
-                    f"Failed to load or parse the configuration file.\n\nError: {e}, "
-                    f"Please make sure you enter {name} manually or load them from a file",
-                )
-                return None
-
-    def build_terminal_inputs(self):
+        try:
+            config = inputs.load_config(config_file_path)
+        except Exception as e:
+            messagebox.showerror(
+                "Loading Error",
+                f"Failed to load or parse the configuration file.\n\nError: {e}, "
+                f"Please make sure you enter {name} manually or load them from a file",
+            )
+            return None
+        self.log(f"Successfully loaded {name} from {config_file_path}")
+        return config
+
+    def _populate_inputs_from_config(self, name, section_name, entries):
+        """
+        Loads a configuration file and fills entry fields from one section.
+
+        :param name: The name of the configuration shown to the user.
+        :param section_name: The section of the file holding the values.
+        :param entries: Pairs of (entry widget, option name) to fill.
+        """
+        config = self.load_config_from_file(name)
+        if not config:
+            return
+        section = config[section_name] if section_name in config else None
+        if section is None:
+            message = f"The selected file does not contain an [{section_name}] section."
+            with self._log_batch():
+                self.log(message)
+            messagebox.showwarning("Invalid File", message)
+            return
+        for entry, option in entries:
+            entry.delete(0, tk.END)
+            entry.insert(0, section.get(option, ""))
+
+    def build_terminal_inputs(self, parent):
         """Builds the input fields for MT5 terminal connection details."""
-        ttk.Label(
-            self.input_frame, text="MT5 TERMINAL INPUTS", font=("Segoe UI", 10, "bold")
-        ).pack(anchor="w", pady=(20, 0))
+        ttk.Label(parent, text="MT5 TERMINAL INPUTS", style="Section.TLabel").pack(
+            anchor="w", pady=(20, 0)
+        )
 
-        path_frame = ttk.Frame(self.input_frame)
+        path_frame = ttk.Frame(parent)
         path_frame.pack(fill="x", pady=10)
 
         # Label in column 0
-        ttk.Label(path_frame, text="Terminal Path", font=("Segoe UI", 9)).grid(
+        ttk.Label(path_frame, text="Terminal Path", style="Field.TLabel").grid(
             row=0, column=0, sticky="e", padx=5
         )
 
@@ -172,25 +297,25 @@ class SentimentTradingApp(object):
             row=0, column=2, padx=5
         )
 
-        label_frame = ttk.LabelFrame(self.input_frame, text="MT5 Credentials")
+        label_frame = ttk.LabelFrame(parent, text="MT5 Credentials")
         label_frame.pack(pady=10, fill="x", padx=5)
 
         # Login
-        ttk.Label(label_frame, text="Login", font=("Segoe UI", 9)).grid(
+        ttk.Label(label_frame, text="Login", style="Field.TLabel").grid(
             row=0, column=0, sticky="e", padx=5, pady=3
         )
         self.mt5_login = ttk.Entry(label_frame, width=30)
         self.mt5_login.grid(row=0, column=1, padx=5, pady=3)
 
         # Password
-        ttk.Label(label_frame, text="Password", font=("Segoe UI", 9)).grid(
+        ttk.Label(label_frame, text="Password", style="Field.TLabel").grid(
             row=1, column=0, sticky="e", padx=5, pady=3
         )
         self.mt5_password = ttk.Entry(label_frame, show="*", width=30)
         self.mt5_password.grid(row=1, column=1, padx=5, pady=3)
 
         # Server
-        ttk.Label(label_frame, text="Server", font=("Segoe UI", 9)).grid(
+        ttk.Label(label_frame, text="Server", style="Field.TLabel").grid(
             row=2, column=0, sticky="e", padx=5, pady=3
         )
         self.mt5_server = ttk.Entry(label_frame, width=30)
@@ -203,53 +328,33 @@ class SentimentTradingApp(object):
 
     def populate_mt5_inputs_from_config(self):
         """Populate GUI fields from config file."""
-        config = self.load_config_from_file("MT5 Credentials")
-        if not config:
-            return
-        # Check if the file contains the required [MT5] section
-        if "MT5" in config:
-            # 1. Clear the current content of the entry fields
-            self.mt5_login.delete(0, tk.END)
-            self.mt5_password.delete(0, tk.END)
-            self.mt5_server.delete(0, tk.END)
-
-            # 2. Insert the new values from the config file
-            self.mt5_login.insert(0, config["MT5"].get("login", ""))
-            self.mt5_password.insert(0, config["MT5"].get("password", ""))
-            self.mt5_server.insert(0, config["MT5"].get("server", ""))
-        else:
-            message = "The selected file does not contain an [MT5] section."
-            self.log(message)
-            messagebox.showwarning("Invalid File", message)
+        self._populate_inputs_from_config(
+            "MT5 Credentials",
+            "MT5",
+            (
+                (self.mt5_login, "login"),
+                (self.mt5_password, "password"),
+                (self.mt5_server, "server"),
+            ),
+        )
 
     def populate_api_inputs_from_config(self):
         """Populate GUI fields from config file."""
-        config = self.load_config_from_file("API Credentials")
-        if not config:
-            return
-        if "API" in config:
-            # 1. Clear the current content of the entry fields
-            self.reddit_client_id.delete(0, tk.END)
-            self.reddit_client_secret.delete(0, tk.END)
-            self.reddit_user_agent.delete(0, tk.END)
-            self.fmp_api.delete(0, tk.END)
-
-            # 2. Insert the new values from the config file
-            self.reddit_client_id.insert(0, config["API"].get("reddit_client_id", ""))
-            self.reddit_client_secret.insert(
-                0, config["API"].get("reddit_client_secret", "")
-            )
-            self.reddit_user_agent.insert(0, config["API"].get("reddit_user_agent", ""))
-            self.fmp_api.insert(0, config["API"].get("fmp_api", ""))
-        else:
-            message = "The selected file does not contain an [API] section."
-            self.log(message)
-            messagebox.showwarning("Invalid File", message)
+        self._populate_inputs_from_config(
+            "API Credentials",
+            "API",
+            (
+                (self.reddit_client_id, "reddit_client_id"),
+                (self.reddit_client_secret, "reddit_client_secret"),
+                (self.reddit_user_agent, "reddit_user_agent"),
+                (self.fmp_api, "fmp_api"),
+            ),
+        )
 
     def load_tickers_from_file(self):
         """Load tickers from a text file."""
         file_path = filedialog.askopenfilename(
-            filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")]
+            parent=self.root, filetypes=TXT_FILETYPES
         )
         # Stop if the user cancelled the dialog
         if not file_path:
@@ -258,49 +363,74 @@ class SentimentTradingApp(object):
         try:
             with open(file_path, "r") as f:
                 tickers = f.read().strip()
-            self.ticker_text.delete("1.0", tk.END)
-            self.ticker_text.insert(tk.END, tickers)
+            self.show_tickers(tickers)
             self.log(f"Loaded tickers from file: {file_path}")
         except Exception as e:
-            self.log(f"Error loading file: {e}")
             error_message = f"Failed to read the ticker file.\n\nError: {e}"
-            self.log(error_message)
+            with self._log_batch():
+                self.log(f"Error loading file: {e}")
+                self.log(error_message)
             messagebox.showerror("File Error", error_message)
 
-    def build_strategy_inputs(self):
+    def show_tickers(self, tickers: str):
+        """
+        Displays tickers in the ticker input.
+        Long lists are parsed and shown in a Treeview, which only renders the
+        visible rows, short ones stay editable in the Text box.
+
+        :param tickers: A string formatted as "MT5_ticker1:ticker1, ...".
+        """
+        # Kept as parsed, Treeview values may come back converted to numbers
+        tree_tickers = None
+        if tickers.count(":") > TICKER_TREE_MIN_ROWS:
+            tree_tickers = inputs.get_tickers(tickers)
+        self.ticker_text.delete("1.0", tk.END)
+        self.ticker_tree.delete(*self.ticker_tree.get_children())
+        self._tree_tickers = tree_tickers
+        if tree_tickers is None:
+            self.ticker_text.insert(tk.END, tickers)
+            self.ticker_tree_frame.grid_remove()
+            self.ticker_text.grid()
+            return
+        for mt5_ticker, ticker in self._tree_tickers.items():
+            self.ticker_tree.insert("", tk.END, values=(mt5_ticker, ticker))
+        self.ticker_text.grid_remove()
+        self.ticker_tree_frame.grid()
+
+    def build_strategy_inputs(self, parent):
         """Builds the input fields for trading strategy configuration."""
         ttk.Label(
-            self.input_frame,
+            parent,
             text="TRADING STRATEGY INPUTS",
-            font=("Segoe UI", 10, "bold"),
+            style="Section.TLabel",
         ).pack(anchor="w", pady=(10, 0))
 
-        label_frame = ttk.LabelFrame(self.input_frame, text="APIs and Secrets")
+        label_frame = ttk.LabelFrame(parent, text="APIs and Secrets")
         label_frame.pack(pady=10, fill="x", padx=5)
 
         # client_id
-        ttk.Label(label_frame, text="Reddit Client ID", font=("Segoe UI", 9)).grid(
+        ttk.Label(label_frame, text="Reddit Client ID", style="Field.TLabel").grid(
             row=1, column=0, sticky="e", padx=5, pady=3
         )
         self.reddit_client_id = ttk.Entry(label_frame, width=30, show="*")
         self.reddit_client_id.grid(row=1, column=1, padx=5, pady=3)
 
         # client_secret
-        ttk.Label(label_frame, text="Reddit Client Secret", font=("Segoe UI", 9)).grid(
+        ttk.Label(label_frame, text="Reddit Client Secret", style="Field.TLabel").grid(
             row=2, column=0, sticky="e", padx=5, pady=3
         )
         self.reddit_client_secret = ttk.Entry(label_frame, width=30, show="*")
         self.reddit_client_secret.grid(row=2, column=1, padx=5, pady=3)
 
         # user_agent
-        ttk.Label(label_frame, text="Reddit User Agent", font=("Segoe UI", 9)).grid(
+        ttk.Label(label_frame, text="Reddit User Agent", style="Field.TLabel").grid(
             row=3, column=0, sticky="e", padx=5, pady=3
         )
         self.reddit_user_agent = ttk.Entry(label_frame, width=30, show="*")
         self.reddit_user_agent.grid(row=3, column=1, padx=5, pady=3)
 
         # fmp_api
-        ttk.Label(label_frame, text="FMP API Key", font=("Segoe UI", 9)).grid(
+        ttk.Label(label_frame, text="FMP API Key", style="Field.TLabel").grid(
             row=4, column=0, sticky="e", padx=5, pady=3
         )
         self.fmp_api = ttk.Entry(label_frame, width=30, show="*")
@@ -312,20 +442,42 @@ class SentimentTradingApp(object):
             command=self.populate_api_inputs_from_config,
         ).grid(row=5, column=1, columnspan=2, sticky="w", padx=5, pady=(0, 10))
 
-        kwargs_label_frame = ttk.LabelFrame(self.input_frame, text="Other Parameters")
+        kwargs_label_frame = ttk.LabelFrame(parent, text="Other Parameters")
         kwargs_label_frame.pack(pady=10, fill="x", padx=5)
 
         # Row 0 - Ticker label
         ttk.Label(
             kwargs_label_frame,
             text="Tickers (MT5_ticker:Ticker)",
-            font=("Segoe UI", 9, "bold"),
+            style="FieldBold.TLabel",
         ).grid(row=0, column=0, columnspan=2, sticky="w", padx=5, pady=(5, 0))
 
         # Row 1 - Ticker input (Text widget)
         self.ticker_text = tk.Text(kwargs_label_frame, height=5, width=40)
         self.ticker_text.grid(row=1, column=0, columnspan=2, padx=5, pady=3)
 
+        # Same cell, used instead of the Text widget for long ticker files
+        self.ticker_tree_frame = ttk.Frame(kwargs_label_frame)
+        self.ticker_tree_frame.grid(row=1, column=0, columnspan=2, padx=5, pady=3)
+        self.ticker_tree = ttk.Treeview(
+            self.ticker_tree_frame,
+            columns=("mt5", "ticker"),
+            show="headings",
+            height=10,
+        )
+        self.ticker_tree.heading("mt5", text="MT5 Ticker")
+        self.ticker_tree.heading("ticker", text="Ticker")
+        self.ticker_tree.column("mt5", width=150)
+        self.ticker_tree.column("ticker", width=150)
+        tree_scrollbar = ttk.Scrollbar(
+            self.ticker_tree_frame, orient="vertical", command=self.ticker_tree.yview
+        )
+        self.ticker_tree.configure(yscrollcommand=tree_scrollbar.set)
+        self.ticker_tree.pack(side="left", fill="both", expand=True)
+        tree_scrollbar.pack(side="right", fill="y")
+        self.ticker_tree_frame.grid_remove()
+        self._tree_tickers = None
+
         # Row 2 - Load button below ticker text
         ttk.Button(
             kwargs_label_frame,
@@ -335,7 +487,7 @@ class SentimentTradingApp(object):
 
         # Row 3 Symbol type
         DEFAULT_SYMBOS_TYPE = "stock"
-        ttk.Label(kwargs_label_frame, text="Symbol type", font=("Segoe UI", 9)).grid(
+        ttk.Label(kwargs_label_frame, text="Symbol type", style="Field.TLabel").grid(
             row=3, column=0, sticky="e", padx=5, pady=3
         )
         self.symbls_type = StringVar()
@@ -351,7 +503,7 @@ class SentimentTradingApp(object):
 
         # Row 4 - Sentiment Threshold
         ttk.Label(
-            kwargs_label_frame, text="Sentiment Threshold", font=("Segoe UI", 9)
+            kwargs_label_frame, text="Sentiment Threshold", style="Field.TLabel"
         ).grid(row=4, column=0, sticky="e", padx=5, pady=3)
 
         self.threshold = ttk.Entry(kwargs_label_frame, width=30)
@@ -360,7 +512,7 @@ class SentimentTradingApp(object):
 
         # Row 5 - Maximum Positions
         ttk.Label(
-            kwargs_label_frame, text="Maximum Positions", font=("Segoe UI", 9)
+            kwargs_label_frame, text="Maximum Positions", style="Field.TLabel"
         ).grid(row=5, column=0, sticky="e", padx=5, pady=3)
 
         self.max_positions = ttk.Entry(kwargs_label_frame, width=30)
@@ -369,27 +521,27 @@ class SentimentTradingApp(object):
 
         # Row 6 - Expected Return Threshold
         ttk.Label(
-            kwargs_label_frame, text="Expected Return (%)", font=("Segoe UI", 9)
+            kwargs_label_frame, text="Expected Return (%)", style="Field.TLabel"
         ).grid(row=6, column=0, sticky="e", padx=5, pady=3)
 
         self.expected_return = ttk.Entry(kwargs_label_frame, width=30)
         self.expected_return.grid(row=6, column=1, padx=5, pady=3, sticky="w")
         self.expected_return.insert(0, "5.0")
 
-    def build_engine_inputs(self):
+    def build_engine_inputs(self, parent):
         """Builds the input fields for trading engine configuration."""
         ttk.Label(
-            self.input_frame,
+            parent,
             text="TRADING ENGINE INPUTS",
-            font=("Segoe UI", 10, "bold"),
+            style="Section.TLabel",
         ).pack(anchor="w", pady=(10, 0))
 
-        params_frame = ttk.LabelFrame(self.input_frame, text="Parameters")
+        params_frame = ttk.LabelFrame(parent, text="Parameters")
         params_frame.pack(fill="x", padx=5, pady=10)
 
         # Time Frame
         DEFAULT_TIMEFRAME = "15m"
-        ttk.Label(params_frame, text="Time Frame", font=("Segoe UI", 9)).grid(
+        ttk.Label(params_frame, text="Time Frame", style="Field.TLabel").grid(
             row=0, column=0, sticky="e", padx=5, pady=3
         )
         self.time_frame = StringVar()
@@ -405,7 +557,7 @@ class SentimentTradingApp(object):
 
         # Starting time (HH:MM)
         ttk.Label(
-            params_frame, text="Starting Time (HH:MM)", font=("Segoe UI", 9)
+            params_frame, text="Starting Time (HH:MM)", style="Field.TLabel"
         ).grid(row=1, column=0, sticky="e", padx=5, pady=3)
         self.start_time = ttk.Entry(params_frame, width=25)
         self.start_time.grid(row=1, column=1, padx=5, pady=3)
@@ -414,7 +566,7 @@ class SentimentTradingApp(object):
         # Finishing time (HH:MM)
         # Stopping new entries
         ttk.Label(
-            params_frame, text="Finishing Time (HH:MM)", font=("Segoe UI", 9)
+            params_frame, text="Finishing Time (HH:MM)", style="Field.TLabel"
         ).grid(row=2, column=0, sticky="e", padx=5, pady=3)
         self.finish_time = ttk.Entry(params_frame, width=25)
         self.finish_time.grid(row=2, column=1, padx=5, pady=3)
@@ -422,7 +574,7 @@ class SentimentTradingApp(object):
 
         # Ending time (HH:MM)
         # closing all positions
-        ttk.Label(params_frame, text="Ending Time (HH:MM)", font=("Segoe UI", 9)).grid(
+        ttk.Label(params_frame, text="Ending Time (HH:MM)", style="Field.TLabel").grid(
             row=3, column=0, sticky="e", padx=5, pady=3
         )
         self.end_time = ttk.Entry(params_frame, width=25)
@@ -430,7 +582,7 @@ class SentimentTradingApp(object):
         self.end_time.insert(0, "23:59")
 
         # Iteration Time
-        ttk.Label(params_frame, text="Iteration Time (min)", font=("Segoe UI", 9)).grid(
+        ttk.Label(params_frame, text="Iteration Time (min)", style="Field.TLabel").grid(
             row=4, column=0, sticky="e", padx=5, pady=3
         )
         self.iter_time = ttk.Entry(params_frame, width=25)
@@ -438,7 +590,7 @@ class SentimentTradingApp(object):
         self.iter_time.insert(0, "15")
 
         # Daily Risk
-        ttk.Label(params_frame, text="Risk/trade (%)", font=("Segoe UI", 9)).grid(
+        ttk.Label(params_frame, text="Risk/trade (%)", style="Field.TLabel").grid(
             row=5, column=0, sticky="e", padx=5, pady=3
         )
         self.daily_risk = ttk.Entry(params_frame, width=25)
@@ -446,7 +598,7 @@ class SentimentTradingApp(object):
         self.daily_risk.insert(0, "0.01")
 
         # Max Risk
-        ttk.Label(params_frame, text="Max Risk (%)", font=("Segoe UI", 9)).grid(
+        ttk.Label(params_frame, text="Max Risk (%)", style="Field.TLabel").grid(
             row=6, column=0, sticky="e", padx=5, pady=3
         )
         self.max_risk = ttk.Entry(params_frame, width=25)
@@ -474,7 +626,7 @@ class SentimentTradingApp(object):
             row_index += 1
 
         # Trading Periods
-        ttk.Label(params_frame, text="Trading Period", font=("Segoe UI", 9)).grid(
+        ttk.Label(params_frame, text="Trading Period", style="Field.TLabel").grid(
             row=row_index, column=0, sticky="w", padx=5, pady=(10, 0)
         )
         self.trading_periods = StringVar(value="month")
@@ -501,14 +653,43 @@ class SentimentTradingApp(object):
             )
 
     def build_inputs(self):
-        """Builds all input fields for the GUI."""
-        self.build_terminal_inputs()
-        self.build_strategy_inputs()
-        self.build_engine_inputs()
+        """
+        Builds the input notebook for the GUI.
+        Each tab's widgets are only created the first time the tab is shown.
+        """
+        self.input_notebook = ttk.Notebook(self.input_frame)
+        self.input_notebook.pack(fill="both", expand=True)
+        self._input_tabs = {}
+        self._built_tabs = set()
+        for text, builder in (
+            ("MT5 Terminal", self.build_terminal_inputs),
+            ("Strategy", self.build_strategy_inputs),
+            ("Engine", self.build_engine_inputs),
+        ):
+            frame = ttk.Frame(self.input_notebook)
+            self.input_notebook.add(frame, text=text)
+            self._input_tabs[str(frame)] = (frame, builder)
+        self.build_input_tab(self.input_notebook.select())
+        self.input_notebook.bind(
+            "<<NotebookTabChanged>>",
+            lambda event: self.build_input_tab(self.input_notebook.select()),
+        )
         ttk.Button(self.input_frame, text="Submit", command=self.handle_submit).pack(
             pady=10
         )
 
+    def build_input_tab(self, tab: str):
+        """
+        Builds the widgets of an input tab if they do not exist yet.
+
+        :param tab: The Tk path name of the tab frame.
+        """
+        if tab in self._built_tabs:
+            return
+        frame, builder = self._input_tabs[tab]
+        builder(frame)
+        self._built_tabs.add(tab)
+
     def zoom_log_area(self, event):
         """Zoom in/out the log area text size with Ctrl + Mouse Wheel."""
         if event.delta > 0:
@@ -516,23 +697,24 @@ class SentimentTradingApp(object):
         else:
             self.log_font_size = max(self.log_font_size - 1, 6)
 
-        self.log_area.configure(font=("Courier", self.log_font_size))
+        # The log area follows the named font, no widget reconfigure needed
+        self.log_font.configure(size=self.log_font_size)
 
     def build_logs(self):
         """Builds the log area for displaying messages."""
         text = "Sentiment-Based Trading System"
-        ttk.Label(self.log_frame, text=text, font=("Segoe UI", 30, "bold")).pack(
-            anchor="w"
-        )
+        ttk.Label(self.log_frame, text=text, style="Header.TLabel").pack(anchor="w")
         self.log_font_size = 10
+        self.log_font = tkfont.Font(family="Courier", size=self.log_font_size)
         self.log_area = scrolledtext.ScrolledText(
             self.log_frame,
             wrap=tk.WORD,
             height=25,
-            font=("Courier", self.log_font_size),
+            font=self.log_font,
         )
         self.log_area.pack(fill="both", expand=True)
         self.log_area.insert(tk.END, "Welcome to the Sentiment-Based Signal System.\n")
+        self.log_area.configure(state="disabled")
         self.log_area.bind("<Control-MouseWheel>", self.zoom_log_area)
 
     def build_prompt(self):
@@ -540,7 +722,7 @@ class SentimentTradingApp(object):
         label = ttk.Label(
             self.prompt_frame,
             text="Enter response (if prompted)",
-            font=("Segoe UI", 10),
+            style="Prompt.TLabel",
         )
         label.pack(side="left", padx=(0, 5))
 
@@ -552,17 +734,27 @@ class SentimentTradingApp(object):
         )
         send_btn.pack(side="left")
 
+        self.engine_progress = ttk.Progressbar(
+            self.prompt_frame, mode="indeterminate", length=120
+        )
+
     def gui_safe_prompt(self, prompt):
-        """Safely handles prompts in the GUI thread."""
+        """
+        Shows a prompt in the log area and waits for the user's response.
+        Must be called from a worker thread, waiting on the GUI thread would
+        block the mainloop that delivers the response.
+        """
+        if threading.current_thread() is threading.main_thread():
+            raise RuntimeError("Prompts cannot be awaited from the GUI thread.")
         self.pending_prompt = prompt
-        self.prompt_response_value = None
-        self.prompt_response_ready.clear()
+        self.log(prompt)
 
-        self.root.after(0, self.log(prompt))
+        # Wait for the response to be sent by the user
+        return self._prompt_queue.get()
 
-        # Wait for the response to be set by the user
-        self.prompt_response_ready.wait()
-        return self.prompt_response_value
+    def gui_safe_logger(self, msg):
+        """Loguru sink, log() only enqueues so it is safe on any thread."""
+        self.log(msg)
 
     def handle_prompt_response(self):
         """Handles the user's response to a prompt."""
@@ -572,75 +764,139 @@ class SentimentTradingApp(object):
         self.log(f">>> User input: {user_input}")
 
         if self.pending_prompt:
-            self.prompt_response_value = user_input
-            self.prompt_response_ready.set()
             self.pending_prompt = None
+            self._prompt_queue.put_nowait(user_input)
 
-    def initialize_engine(self, symbols_list, trades, **kwargs):
-        """Initializes the trading engine with the provided parameters."""
-        if hasattr(self, "trade_engine") and self.trade_engine:
-            # Stop any existing engine before starting a new one
-            self.trade_engine.stop()
-        self.trade_engine = Mt5ExecutionEngine(
-            symbols_list,
-            trades,
-            SentimentTrading,
-            period_end_action="sleep",
-            closing_pnl=10.0,
-            prompt_callback=self.gui_safe_prompt,
-            **kwargs,
+    def initialize_engine(self, symbols_list, trade_kwargs, **kwargs):
+        """
+        Initializes the trading engine with the provided parameters.
+        The trade instances and the engine connect to MT5 when they are
+        created, so their creation and the run loop happen on the engine thread.
+        """
+        # Stop any existing engine before starting a new one. A cancelled
+        # engine exits before the one it waited for, so the new engine waits
+        # for every previous one that is still running
+        previous_threads = [t for t in self._engine_threads if t.is_alive()]
+        self._stop_engine()
+        self._engine_stop = threading.Event()
+        self._engine_started.clear()
+        self._engine_thread = threading.Thread(
+            target=self._run_engine,
+            args=(self._engine_stop, previous_threads, symbols_list, trade_kwargs),
+            kwargs=kwargs,
+            name="strader-engine",
+            daemon=True,
         )
-        threading.Thread(target=self.trade_engine.run, daemon=True).start()
+        self._engine_thread.start()
+        self._engine_threads = previous_threads + [self._engine_thread]
+        self.engine_progress.pack(side="left", padx=(5, 0))
+        self.engine_progress.start()
+        self.root.after(ENGINE_PROGRESS_INTERVAL_MS, self._poll_engine_startup)
+
+    def _stop_engine(self):
+        """Signals the current engine, running or still starting, to stop."""
+        with self._engine_lock:
+            self._engine_stop.set()
+            # stop() does not wake an engine waiting on a prompt
+            if self.pending_prompt:
+                self.pending_prompt = None
+                self._prompt_queue.put_nowait(PROMPT_CANCELLED)
+            if self.trade_engine:
+                self.trade_engine.stop()
+                self.trade_engine = None
+
+    def _run_engine(
+        self, stop_event, previous_threads, symbols_list, trade_kwargs, **kwargs
+    ):
+        """
+        Creates and runs the trading engine, called on the engine thread.
+
+        :param stop_event: Set when this engine must not start or keep running.
+        :param previous_threads: The threads of the engines being replaced.
+        :param trade_kwargs: The arguments of the per-symbol Trade instances.
+        """
+        # Only one engine may use the terminal at a time. A stopped engine
+        # only exits once its current iteration sleep is over
+        waiting = [t for t in previous_threads if t.is_alive()]
+        logged = False
+        while waiting:
+            if stop_event.is_set():
+                self.log("Trading engine cancelled before starting.")
+                return
+            waiting[0].join(timeout=ENGINE_JOIN_TIMEOUT)
+            waiting = [t for t in waiting if t.is_alive()]
+            if waiting and not logged:
+                self.log("Waiting for the previous engine to finish its iteration...")
+                logged = True
+        # Creating the trade instances already connects to the terminal
+        if stop_event.is_set():
+            self.log("Trading engine cancelled before starting.")
+            return
+        try:
+            trades = inputs.get_trade_instances(symbols_list, trade_kwargs)
+            engine = Mt5ExecutionEngine(
+                symbols_list,
+                trades,
+                SentimentTrading,
+                period_end_action="sleep",
+                closing_pnl=10.0,
+                prompt_callback=self.gui_safe_prompt,
+                **kwargs,
+            )
+            with self._engine_lock:
+                if stop_event.is_set():
+                    self.log("Trading engine cancelled before starting.")
+                    return
+                self.trade_engine = engine
+            self._engine_started.set()
+            self.log("Trading engine initialized.")
+            engine.run()
+        except Exception as e:
+            self.log(f"Trading engine error: {e}")
+
+    def _poll_engine_startup(self):
+        """Keeps the progress bar running until the engine has started."""
+        if self._engine_started.is_set() or not self._engine_thread.is_alive():
+            self.engine_progress.stop()
+            self.engine_progress.pack_forget()
+            return
+        self.root.after(ENGINE_PROGRESS_INTERVAL_MS, self._poll_engine_startup)
+
+    def _parse_input(self, name, input_type, default, label):
+        """
+        Reads and validates a single entry field.
+        The last valid result is memoized per field, so unchanged fields are
+        not converted again on the next submit.
+
+        :param name: The attribute name of the entry widget.
+        :param input_type: The expected type of the input.
+        :param default: The value returned when the field is empty.
+        :param label: The name of the input for error messages.
+        :return: The parsed value, the default, or None if invalid.
+        """
+        raw = getattr(self, name).get().strip()
+        if not raw:
+            return default
+        cached = self._parsed_inputs.get(name)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        value = inputs.validate_input(raw, input_type, label)
+        if value is not None:
+            self._parsed_inputs[name] = (raw, value)
+        return value
 
     def get_inputs(self):
         """Collects and validates all input fields from the GUI."""
-        tickers = inputs.get_tickers(self.ticker_text.get("1.0", tk.END).strip())
+        if self._tree_tickers:
+            tickers = dict(self._tree_tickers)
+        else:
+            tickers = inputs.get_tickers(self.ticker_text.get("1.0", tk.END).strip())
         mt5_path = inputs.get_mt5_path(self.mt5_path.get().strip())
-        mt5_login = inputs.validate_input(
-            self.mt5_login.get().strip(), int, "MT5 Login"
-        )
-        daily_risk = (
-            inputs.validate_input(
-                self.daily_risk.get().strip(), float, "Daily Risk (percentage)"
-            )
-            if self.daily_risk.get().strip()
-            else 0.01
-        )
-        max_risk = (
-            inputs.validate_input(
-                self.max_risk.get().strip(), float, "Max Risk (percentage)"
-            )
-            if self.max_risk.get().strip()
-            else 10.0
-        )
-        threshold = (
-            inputs.validate_input(
-                self.threshold.get().strip(), float, "Sentiment Threshold"
-            )
-            if self.threshold.get().strip()
-            else 0.2
-        )
-        max_positions = (
-            inputs.validate_input(
-                self.max_positions.get().strip(), int, "Max Positions"
-            )
-            if self.max_positions.get().strip()
-            else 100
-        )  # Default value for
-
-        # Expected return
-        expected_return = (
-            inputs.validate_input(
-                self.expected_return.get().strip(), float, "Expected Return"
-            )
-            if self.expected_return.get().strip()
-            else 5.0
-        )
-        iter_time = (
-            inputs.validate_input(self.iter_time.get().strip(), int, "Iteration Time")
-            if self.iter_time.get().strip()
-            else 15
-        )  # Default value for iteration time
+        mt5_login = self._parse_input("mt5_login", int, None, "MT5 Login")
+        numeric = {
+            name: self._parse_input(name, input_type, default, label)
+            for name, input_type, default, label in NUMERIC_INPUTS
+        }
         mm_enabled = self.mm_enabled.get() == "True"
         auto_trade_enabled = self.auto_trade_enabled.get() == "True"
         debug_mode_enabled = self.debug_mode_enabled.get() == "True"
@@ -650,12 +906,12 @@ class SentimentTradingApp(object):
             tickers,
             mt5_path,
             mt5_login,
-            daily_risk,
-            max_risk,
-            threshold,
-            max_positions,
-            expected_return,
-            iter_time,
+            numeric["daily_risk"],
+            numeric["max_risk"],
+            numeric["threshold"],
+            numeric["max_positions"],
+            numeric["expected_return"],
+            numeric["iter_time"],
             mm_enabled,
             auto_trade_enabled,
             debug_mode_enabled,
@@ -664,6 +920,9 @@ class SentimentTradingApp(object):
 
     def handle_submit(self):
         """Handles the submission of input fields and initializes the trading engine."""
+        # Fields of tabs that were never opened still hold their defaults
+        for tab in self._input_tabs:
+            self.build_input_tab(tab)
         # Collect inputs from the GUI
         (
             tickers,
@@ -680,64 +939,61 @@ class SentimentTradingApp(object):
             debug_mode_enabled,
             notification_enabled,
         ) = self.get_inputs()
+        # Read each field once, every get() is a round trip into Tcl
+        mt5_password = self.mt5_password.get().strip()
+        mt5_server = self.mt5_server.get().strip()
+        time_frame = self.time_frame.get().strip()
+        trading_period = self.trading_periods.get().strip()
+        symbols_type = self.symbls_type.get().strip()
 
         if not all(
             [
                 tickers,
                 mt5_path,
                 mt5_login,
-                self.mt5_password.get().strip(),
-                self.mt5_server.get().strip(),
+                mt5_password,
+                mt5_server,
             ]
         ):
             err_msg = "MT5 Credentials missing, Please fill in all fields, (e.g., login, password, server, path)"
-            self.log(err_msg)
+            with self._log_batch():
+                self.log(err_msg)
             messagebox.showerror("Invalid Credentilas", err_msg)
             return
 
-        if (
-            not self.time_frame.get().strip()
-            or self.time_frame.get().strip() not in MT5_ENGINE_TIMEFRAMES
-        ):
+        if not time_frame or time_frame not in MT5_ENGINE_TIMEFRAMES:
             err_msg = (
                 f"Please select a valid time frame, e.g., ({MT5_ENGINE_TIMEFRAMES}) "
             )
-            self.log(err_msg)
+            with self._log_batch():
+                self.log(err_msg)
             messagebox.showerror("Invalid Time frame", err_msg)
             return
 
-        if self.trading_periods.get().strip() not in ["month", "week", "day", "24/7"]:
+        if trading_period not in ["month", "week", "day", "24/7"]:
             err_msg = (
                 "Please select a valid trading period, e.g., (month, week, day, 24/7)"
             )
-            self.log(err_msg)
+            with self._log_batch():
+                self.log(err_msg)
             messagebox.showerror("Invalid period", err_msg)
             return
-        if self.symbls_type.get().strip() not in SYMBOLS_TYPE:
+        if symbols_type not in SYMBOLS_TYPE:
             err_msg = (
                 f"Please select a valid symbols_type, e.g., ({','.join(SYMBOLS_TYPE)})"
             )
-            self.log(err_msg)
+            with self._log_batch():
+                self.log(err_msg)
             messagebox.showerror("Invalid Symbol type", err_msg)
             return
 
         self.log("Initializing trading engine...")
 
-        def gui_safe_logger(msg):
-            # Ensures GUI thread safety
-            self.log_frame.after(0, self.log(msg))
-
-        logger.add(
-            gui_safe_logger,
-            level="DEBUG",
-            format="{time:YYYY-MM-DD HH:mm:ss} {level} {message}",
-        )
-
         mt5_con_kwargs = {
             "path": mt5_path,
             "login": mt5_login,
-            "password": self.mt5_password.get().strip(),
-            "server": self.mt5_server.get().strip(),
+            "password": mt5_password,
+            "server": mt5_server,
             "copy": True,
         }
         symbols_list = list(tickers.keys())
@@ -745,7 +1001,7 @@ class SentimentTradingApp(object):
         trade_kwargs = {
             **mt5_con_kwargs,
             "expert_id": SentimentTrading.ID,
-            "time_frame": self.time_frame.get().strip(),
+            "time_frame": time_frame,
             "start_time": self.start_time.get().strip(),
             "finishing_time": self.finish_time.get().strip(),
             "ending_time": self.end_time.get().strip(),
@@ -754,13 +1010,14 @@ class SentimentTradingApp(object):
             "daily_risk": daily_risk,
             "logger": logger,
         }
-        trade_instances = inputs.get_trade_instances(symbols_list, trade_kwargs)
+        # Trade instances connect to MT5, they are created on the engine thread
+        instance_kwargs = dict(trade_kwargs)
         del trade_kwargs["logger"]
         del trade_kwargs["max_trades"]
 
         strategy_kwargs = {
             "symbols": tickers,
-            "symbols_type": self.symbls_type.get().strip(),
+            "symbols_type": symbols_type,
             "threshold": threshold,
             "max_positions": max_positions,
             "expected_return": expected_return,
@@ -769,6 +1026,10 @@ class SentimentTradingApp(object):
             "user_agent": self.reddit_user_agent.get().strip(),
             "fmp_api": self.fmp_api.get().strip(),
             "max_trades": max_trades,
+            # The strategy waits at most half an iteration for the sentiments,
+            # a slower fetch is used by the next iteration if not older than one
+            "sentiment_timeout": iter_time * 60 / 2,
+            "sentiment_max_age": iter_time * 60,
             "logger": logger,
         }
 
@@ -776,9 +1037,9 @@ class SentimentTradingApp(object):
             "mm": mm_enabled,
             "auto_trade": auto_trade_enabled,
             "iter_time": iter_time,
-            "period": self.trading_periods.get().strip(),
+            "period": trading_period,
             "comment": f"{SentimentTrading.NAME}",
-            "account": f"{mt5_login}@{self.mt5_server.get().strip().split('-')[0]}",
+            "account": f"{mt5_login}@{mt5_server.split('-')[0]}",
             "strategy_name": SentimentTrading.NAME,
             "debug_mode": debug_mode_enabled,
             "notify": notification_enabled,
@@ -789,7 +1050,7 @@ class SentimentTradingApp(object):
 
         self.initialize_engine(
             symbols_list,
-            trade_instances,
+            instance_kwargs,
             **engine_kwargs,
         )
         # Start live chart update loop
@@ -799,7 +1060,12 @@ class SentimentTradingApp(object):
         if not hasattr(self, "root") or not self.root.winfo_exists():
             return  # Do not schedule if window is closed
 
-        self.update_charts(self.get_sentiments())
+        # Nothing is rendered while the window is minimized or hidden, only
+        # check back from time to time
+        if self.root.state() in ("iconic", "withdrawn") or not self._chart_visible:
+            interval_ms *= 4
+        else:
+            self.update_charts(self.get_sentiments())
 
         # Cancel previous job if any
         if self._chart_update_job is not None:
@@ -819,49 +1085,255 @@ class SentimentTradingApp(object):
             return {}
         return self.trade_engine.strategy.sentiments
 
-    def build_charts(self):
+    def build_chart_placeholder(self):
+        """
+        Shows a placeholder in the chart area.
+        The chart itself, and matplotlib, are only loaded by ``update_charts``
+        once there are sentiments to plot.
+        """
         self.chart_canvas = None
-        self.update_charts(self.get_sentiments())
+        self.chart_placeholder = ttk.Label(
+            self.chart_frame,
+            text="Sentiment chart will appear once the engine is running.",
+            style="Prompt.TLabel",
+        )
+        self.chart_placeholder.pack(anchor="center", expand=True)
+
+    def build_charts(self):
+        """
+        Builds the sentiment chart once.
+        The axes, labels and zero line are static and cached as a background
+        image, only the bars are redrawn on each update.
+        """
+        self.chart_placeholder.destroy()
+        # Imported here so importing this module does not load matplotlib,
+        # the canvas is embedded directly and needs no pyplot backend
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        # Built without pyplot, the figure is owned by the embedded canvas
+        self.chart_fig = Figure(figsize=(8, 6))
+        self.chart_ax = self.chart_fig.add_subplot(111)
+        self.chart_ax.axvline(0, color="black", linewidth=1)
+        self.chart_ax.set_title("Top Positive & Negative Ticker Sentiments")
+        self.chart_ax.set_xlabel("Sentiment Score")
+        self.chart_ax.set_ylabel("Tickers")
+        self.chart_ax.set_xlim(-SENTIMENT_LIMIT, SENTIMENT_LIMIT)
+        self.chart_ax.set_autoscalex_on(False)
+        self.chart_fig.tight_layout()
+        self._chart_label_width = 0
+
+        # Bar artist per plotted ticker, and the tickers in plotting order
+        self._chart_bars = {}
+        self._chart_tickers = []
+        self._chart_bg = None
+        self.chart_canvas = FigureCanvasTkAgg(self.chart_fig, master=self.chart_frame)
+        self.chart_canvas.get_tk_widget().pack(fill="both", expand=True)
+        # Any full redraw (e.g. a resize) refreshes the cached background
+        self.chart_canvas.mpl_connect("draw_event", self._on_chart_draw)
+        self.chart_canvas.draw()
+
+    def _on_chart_map(self, event):
+        """Resumes chart updates right away when the chart is shown again."""
+        if self._chart_visible:
+            return
+        self._chart_visible = True
+        if self._chart_update_job is not None:
+            self.start_chart_update_loop()
+
+    def _on_chart_unmap(self, event):
+        self._chart_visible = False
+
+    def _on_chart_draw(self, event):
+        """Caches the static chart background and paints the animated bars."""
+        self._chart_bg = self.chart_canvas.copy_from_bbox(self.chart_ax.bbox)
+        self._draw_chart_bars()
+
+    def _draw_chart_bars(self):
+        for bar in self._chart_bars.values():
+            self.chart_ax.draw_artist(bar)
+
+    def _blit_chart(self):
+        """Repaints only the bars on top of the cached background."""
+        if self._chart_bg is None:
+            self.chart_canvas.draw()
+            return
+        self.chart_canvas.restore_region(self._chart_bg)
+        self._draw_chart_bars()
+        self.chart_canvas.blit(self.chart_ax.bbox)
+        self.chart_canvas.flush_events()
+
+    def _rebuild_chart_bars(self, tickers, scores, colors):
+        """Replaces the bars when the set of plotted tickers changes."""
+        for bar in self._chart_bars.values():
+            bar.remove()
+        bars = self.chart_ax.barh(
+            range(len(tickers)), scores, color=colors.tolist(), animated=True
+        )
+        self._chart_bars = dict(zip(tickers, bars))
+        self._order_chart_bars(tickers)
+        self.chart_ax.relim()
+        self.chart_ax.autoscale_view(scalex=False)
+        self._set_chart_xlim(scores)
+        # Margins only depend on the widest tick label, skip the layout
+        # solver when its rendered width did not change
+        renderer = self.chart_canvas.get_renderer()
+        label_width = max(
+            (
+                round(label.get_window_extent(renderer).width)
+                for label in self.chart_ax.get_yticklabels()
+            ),
+            default=0,
+        )
+        if label_width != self._chart_label_width:
+            self._chart_label_width = label_width
+            self.chart_fig.tight_layout()
+        self._schedule_redraw(full=True)
+
+    def _order_chart_bars(self, tickers):
+        """Moves the existing bars and tick labels to the given ticker order."""
+        for position, ticker in enumerate(tickers):
+            bar = self._chart_bars[ticker]
+            bar.set_y(position - bar.get_height() / 2)
+        self.chart_ax.set_yticks(range(len(tickers)))
+        self.chart_ax.set_yticklabels(tickers)
+        self._chart_tickers = tickers
+
+    def _set_chart_xlim(self, scores):
+        """Sets a symmetric x range, widened only if a score falls outside it."""
+        bound = np.abs(scores).max(initial=SENTIMENT_LIMIT)
+        self.chart_ax.set_xlim(-bound, bound)
+
+    def _schedule_redraw(self, full=False):
+        """
+        Requests a chart repaint, coalescing bursts of updates into a single
+        paint on the next idle cycle, and at most one paint every
+        CHART_MIN_REDRAW_INTERVAL_MS.
+
+        :param full: Whether the static background must be redrawn as well.
+        """
+        self._redraw_full = self._redraw_full or full
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        elapsed_ms = (time.monotonic() - self._last_redraw_ts) * 1000
+        if elapsed_ms < CHART_MIN_REDRAW_INTERVAL_MS:
+            delay_ms = int(CHART_MIN_REDRAW_INTERVAL_MS - elapsed_ms) + 1
+            self.root.after(delay_ms, self._flush_redraw)
+        else:
+            self.root.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        full = self._redraw_full
+        self._redraw_pending = False
+        self._redraw_full = False
+        self._last_redraw_ts = time.monotonic()
+        if full:
+            self.chart_canvas.draw_idle()
+        else:
+            self._blit_chart()
+
+    @staticmethod
+    def _sentiment_signature(sentiment_dict: dict) -> bytes:
+        """
+        Returns a short digest of the tickers and their scores.
+        Unlike keeping a reference to the last dict, this also detects a dict
+        that was updated in place by the strategy.
+        """
+        tickers = sorted(sentiment_dict)
+        scores = np.fromiter(
+            (sentiment_dict[ticker] for ticker in tickers),
+            dtype=np.float64,
+            count=len(tickers),
+        )
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update("\0".join(tickers).encode())
+        digest.update(scores.tobytes())
+        return digest.digest()
 
     def update_charts(self, sentiment_dict: dict):
-        if not self.root.winfo_exists():
+        if not self.root.winfo_exists() or not self._chart_visible:
             return
-        if sentiment_dict == self._last_sentiments:
+        sentiment_sig = self._sentiment_signature(sentiment_dict)
+        if sentiment_sig == self._last_sentiment_sig:
             return  # Skip replot if nothing has changed
-        self._last_sentiments = sentiment_dict
-        if self.chart_canvas:
-            self.chart_canvas.get_tk_widget().destroy()
-        threshold = (
-            inputs.validate_input(
-                self.threshold.get().strip(), float, "Sentiment Threshold"
-            )
-            if self.threshold.get().strip()
-            else 0.2
+        self._last_sentiment_sig = sentiment_sig
+        if self.chart_canvas is None:
+            self.build_charts()
+        threshold = self._parse_input("threshold", float, 0.2, "Sentiment Threshold")
+        keys = np.array(list(sentiment_dict), dtype=object)
+        values = np.fromiter(
+            sentiment_dict.values(), dtype=np.float64, count=len(sentiment_dict)
         )
         # only plot sentiments values > self.threshold
-        sentiment_dict = {
-            k: v for k, v in sentiment_dict.items() if abs(v) >= threshold / 2
-        }
-        # sort by sentiment score
-        sentiment_dict = dict(
-            sorted(sentiment_dict.items(), key=lambda item: item[1], reverse=True)
-        )
-        tickers = list(sentiment_dict.keys())
-        scores = list(sentiment_dict.values())
-        colors = ["green" if s >= 0 else "red" for s in scores]
-
-        fig, ax = plt.subplots(figsize=(8, 6))
-        ax.barh(tickers, scores, color=colors)
-        ax.axvline(0, color="black", linewidth=1)
-        ax.set_title("Top Positive & Negative Ticker Sentiments")
-        ax.set_xlabel("Sentiment Score")
-        ax.set_ylabel("Tickers")
-
-        fig.tight_layout()
-        self.chart_canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        self.chart_canvas.draw()
-        self.chart_canvas.get_tk_widget().pack(fill="both", expand=True)
+        mask = np.abs(values) >= threshold / 2
+        keys, values = keys[mask], values[mask]
+        # sort by sentiment score, highest first
+        order = np.argsort(-values, kind="stable")
+        keys, scores = keys[order], values[order]
+        colors = np.where(scores >= 0, "green", "red")
+        tickers = keys.tolist()
+
+        if self._chart_bars.keys() != set(tickers):
+            self._rebuild_chart_bars(tickers, scores, colors)
+            return
+
+        for ticker, score, color in zip(tickers, scores, colors):
+            bar = self._chart_bars[ticker]
+            bar.set_width(score)
+            bar.set_color(color)
+        # Tick labels and axes limits are part of the background, changing
+        # them needs a full redraw, otherwise only the bars are blitted
+        full = False
+        if tickers != self._chart_tickers:
+            self._order_chart_bars(tickers)
+            full = True
+        xmin, xmax = self.chart_ax.get_xlim()
+        if scores.size and (scores.min() < xmin or scores.max() > xmax):
+            self._set_chart_xlim(scores)
+            full = True
+        self._schedule_redraw(full=full)
 
     def log(self, message):
-        self.log_area.insert(tk.END, message + "\n")
-        self.log_area.see(tk.END)
+        """
+        Queues a message for the log area.
+        Safe to call from any thread, messages are written to the widget
+        by ``_drain_logs`` on the Tk thread.
+        """
+        self._log_buffer.append(message)
+
+    @contextlib.contextmanager
+    def _log_batch(self):
+        """
+        Groups the log calls made inside the block into one widget update,
+        written as soon as the block exits instead of on the next drain tick.
+        Used before modal dialogs so the log is current while they are shown.
+        """
+        try:
+            yield
+        finally:
+            self._flush_logs()
+            self.log_area.update_idletasks()
+
+    def _flush_logs(self):
+        """Writes pending log messages to the log area in a single insert."""
+        batch = []
+        try:
+            while len(batch) < LOG_DRAIN_BATCH_SIZE:
+                batch.append(self._log_buffer.popleft())
+        except IndexError:
+            pass
+        if batch:
+            self.log_area.configure(state="normal")
+            self.log_area.insert(tk.END, "\n".join(batch) + "\n")
+            # Drop the oldest lines so the widget does not grow without bound
+            lines = int(self.log_area.index("end-1c").split(".")[0])
+            if lines > LOG_MAX_LINES:
+                self.log_area.delete("1.0", f"{lines - LOG_MAX_LINES + 1}.0")
+            self.log_area.configure(state="disabled")
+            self.log_area.see(tk.END)
+
+    def _drain_logs(self):
+        """Flushes the log queue periodically on the Tk thread."""
+        self._flush_logs()
+        self._log_drain_job = self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_logs)
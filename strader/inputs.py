@@ -1,10 +1,14 @@
 import configparser
+import re
 from pathlib import Path
 from tkinter import messagebox
 from typing import Dict, List, Type
 
 from bbstrader.metatrader.trade import Trade, create_trade_instance
 
+# Whitespace, newlines and quotes are not part of the tickers string format
+_TICKERS_JUNK = re.compile(r'[\s"]+')
+
 
 def load_config(filepath):
     config = configparser.ConfigParser(interpolation=None)
@@ -46,10 +50,8 @@ def get_tickers(tickers: str) -> Dict[str, str]:
     """
     if not tickers:
         messagebox.showerror("Input Error", "Tickers string cannot be empty.")
-    string = tickers.strip().replace("\n", "").replace(" ", "").replace('"""', "")
-    if string.endswith(","):
-        string = string[:-1]
-    return dict(item.split(":") for item in string.split(","))
+    string = _TICKERS_JUNK.sub("", tickers).rstrip(",")
+    return dict(item.split(":", 1) for item in string.split(",") if item)
 
 
 def get_mt5_path(path: str):
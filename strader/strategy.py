@@ -1,9 +1,16 @@
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from queue import Queue
 from tkinter import messagebox
-from typing import List
+from typing import Dict, List, Tuple
+
+import numpy as np
 
 from bbstrader.btengine import DataHandler, Events, MT5Strategy
-from bbstrader.metatrader import TradeAction, TradeSignal, TradingMode
+from bbstrader.metatrader import Account, TradeAction, TradeSignal, TradingMode
 from bbstrader.metatrader.trade import EXPERT_ID
 from bbstrader.models import LEXICON, SentimentAnalyzer  # noqa: F401
 
@@ -44,6 +51,12 @@ class SentimentTrading(MT5Strategy):
                 - expected_return (float): Expected return threshold for exit signals for each symbol.
                 - symbols (dict): Mapping of MT5 symbols to external (Yahoo Finance) tickers.
                 - symbols_type (str): Can be "stock", "etf", "future", "forex", "crypto", "index".
+                - sentiment_timeout (float): Seconds to wait for the sentiment fetch before
+                    skipping an iteration, the fetch keeps running for the next one.
+                    Waits for the fetch to finish if not set.
+                - sentiment_max_age (float): Seconds after which a result left over from a
+                    timed out fetch is too old to trade on, usually one engine iteration.
+                    Defaults to 300.
 
         """
         self.bars = bars
@@ -67,8 +80,23 @@ class SentimentTrading(MT5Strategy):
         self.max_positions = kwargs.get("max_positions", len(self.tickers))
         _max_trades = kwargs.get("max_trades", self.max_positions // len(self.tickers))
         self.max_trades = {s: _max_trades for s in self.tickers.keys()}
+        # The ticker mapping does not change after init, derive its views once
+        self._ticker_values = tuple(self.tickers.values())
+        # Reversed so the first symbol wins when several share a ticker
+        self._ticker_to_symbol = {v: k for k, v in reversed(self.tickers.items())}
+        # Same mapping as aligned arrays, to look up held tickers without a
+        # Python call per ticker
+        self._mapped_tickers = np.array(list(self._ticker_to_symbol), dtype=str)
+        self._mapped_symbols = np.array(
+            list(self._ticker_to_symbol.values()), dtype=str
+        )
+        self.sentiment_timeout = kwargs.get("sentiment_timeout")
+        self.sentiment_max_age = kwargs.get("sentiment_max_age", 300.0)
         self.analyser = SentimentAnalyzer()
         self._sentiments = {}
+        self._sentiment_future = None
+        self._sentiment_fetched_at = 0.0
+        self._mt5_account = None
         del _max_trades
 
     @property
@@ -88,15 +116,33 @@ class SentimentTrading(MT5Strategy):
         """
         ...
 
-    def _ismax_postions(self):
+    def _get_account(self) -> Account:
+        """
+        Returns the MT5 account used for live queries.
+        Created on first use and reused, instead of a new Account per query.
+
+        Returns:
+            Account: The MT5 account of this strategy.
+        """
+        if self._mt5_account is None:
+            self._mt5_account = Account(**self.kwargs)
+        return self._mt5_account
+
+    def _get_positions_prices(self) -> Tuple[int, Dict[Tuple[str, int], np.ndarray]]:
         """
-        Checks whether the strategy has reached the maximum allowed open positions.
+        Fetches the strategy's open positions once and groups their open prices.
 
         Returns:
-            bool: True if max_positions limit is reached, False otherwise.
+            Tuple[int, dict]: Number of open positions with the strategy ID as
+                magic number, and their open prices keyed by (symbol, type),
+                where type is 0 for buys and 1 for sells.
         """
-        positions = [p for p in self.positions if p.magic == self.ID]
-        return len(positions) >= self.max_positions
+        prices = defaultdict(list)
+        for position in self._get_account().get_positions() or []:
+            if position.magic == self.ID:
+                prices[(position.symbol, position.type)].append(position.price_open)
+        count = sum(len(p) for p in prices.values())
+        return count, {key: np.array(value) for key, value in prices.items()}
 
     def _get_mt5_equivalent(self, ticker) -> str:
         """
@@ -108,7 +154,39 @@ class SentimentTrading(MT5Strategy):
         Returns:
             str: MT5 symbol.
         """
-        return list(self.tickers.keys())[list(self.tickers.values()).index(ticker)]
+        return self._ticker_to_symbol[ticker]
+
+    def _submit_sentiment_fetch(self, tickers: Tuple[str, ...]) -> Future:
+        """
+        Starts fetching sentiment scores in the background.
+        The fetch runs on a daemon thread, so a slow fetch does not keep the
+        process alive once the application is closed.
+
+        Args:
+            tickers (Tuple[str, ...]): External tickers to fetch.
+
+        Returns:
+            Future: Resolves to the ticker to sentiment score mapping.
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+
+        def fetch():
+            try:
+                sentiments = self.analyser.get_sentiment_for_tickers(
+                    tickers,
+                    lexicon=LEXICON[self.symbol_type],
+                    asset_type=self.symbol_type,
+                    **self.kwargs,
+                )
+            except Exception as e:
+                future.set_exception(e)
+                return
+            self._sentiment_fetched_at = time.monotonic()
+            future.set_result(sentiments)
+
+        threading.Thread(target=fetch, name="strader-sentiment", daemon=True).start()
+        return future
 
     def _calculate_live_signals(self):
         """
@@ -118,100 +196,157 @@ class SentimentTrading(MT5Strategy):
             List[TradeSignal]: List of trade signals based on sentiment thresholds.
         """
         signals: List[TradeSignal] = []
-        tickers = list(self.tickers.values())
+        tickers = self._ticker_values
         if len(tickers) == 0:
             return signals
 
-        to_show = ", ".join(tickers[:5])
-        self.logger.info(f"Fetching sentiments for tickers: {to_show}...")
+        # Messages are only built if the level is enabled
+        self.logger.opt(lazy=True).info(
+            "Fetching sentiments for tickers: {}...", lambda: ", ".join(tickers[:5])
+        )
 
+        # A fetch that outlives the timeout is not restarted, its result is
+        # used by the next iteration instead, unless it finished too long ago
+        if (
+            self._sentiment_future is not None
+            and self._sentiment_future.done()
+            and self._sentiment_future.exception() is None
+            and time.monotonic() - self._sentiment_fetched_at > self.sentiment_max_age
+        ):
+            self.logger.warning("Discarding outdated sentiments, fetching again.")
+            self._sentiment_future = None
+        if self._sentiment_future is None:
+            self._sentiment_future = self._submit_sentiment_fetch(tickers)
         try:
-            sentiments = self.analyser.get_sentiment_for_tickers(
-                tickers,
-                lexicon=LEXICON[self.symbol_type],
-                asset_type=self.symbol_type,
-                **self.kwargs,
+            sentiments = self._sentiment_future.result(timeout=self.sentiment_timeout)
+        except FutureTimeoutError:
+            self.logger.warning(
+                "Sentiment fetch still running, skipping this iteration."
             )
+            return signals
         except Exception as e:
+            self._sentiment_future = None
             err_msg = f"Error fetching sentiments: {e}"
             self.logger.error(err_msg)
             messagebox.showerror("Error", err_msg)
             return signals
+        self._sentiment_future = None
         self._sentiments = sentiments
-        to_show = {s: round(sentiments[s], 3) for s in tickers[:4]}
-        self.logger.debug(f"Sentiment Fectched for {to_show}...")
+        self.logger.opt(lazy=True).debug(
+            "Sentiment Fectched for {}...",
+            lambda: {
+                s: round(sentiments[s], 3) for s in tickers[:4] if s in sentiments
+            },
+        )
 
-        for ticker, score in sentiments.items():
+        # Positions are fetched once per pass, signals generated below are
+        # counted as they are added instead of querying the account again
+        account = self._get_account()
+        open_positions, positions_prices = self._get_positions_prices()
+        new_positions = 0
+        no_prices = np.array([])
+
+        # Loop invariants are bound once instead of on every ticker
+        short_threshold = -self.threshold / 2
+        ext_th = self.ext_th
+        half_ext_th = ext_th / 2
+        strategy_id = self.ID
+        max_positions = self.max_positions
+
+        # Score thresholds for all tickers at once, only tickers whose score
+        # crosses a threshold or that hold positions can produce a signal
+        scored_tickers = list(sentiments)
+        scores = np.fromiter(
+            sentiments.values(), dtype=np.float64, count=len(scored_tickers)
+        )
+        long_mask = scores >= self.threshold
+        short_mask = scores <= short_threshold
+        held_symbols = [symbol for symbol, _ in positions_prices]
+        held_tickers = self._mapped_tickers[np.isin(self._mapped_symbols, held_symbols)]
+        held_mask = np.isin(np.array(scored_tickers, dtype=str), held_tickers)
+
+        for i in np.flatnonzero(long_mask | short_mask | held_mask):
+            ticker = scored_tickers[i]
+            score = sentiments[ticker]
+            is_long, is_short = long_mask[i], short_mask[i]
             symbol = self._get_mt5_equivalent(ticker)
 
             # Check if EXIT conditions are met
             exit_signal = None
-            buys = self.get_positions_prices(symbol, self.ID, 0)
-            sells = self.get_positions_prices(symbol, self.ID, 1)
-            if (
-                self.exit_positions(0, buys, symbol, th=self.ext_th)
-                or score <= -self.threshold / 2
-            ):
+            buys = positions_prices.get((symbol, 0), no_prices)
+            sells = positions_prices.get((symbol, 1), no_prices)
+            max_trades = self.max_trades[symbol]
+            if is_short or self.exit_positions(0, buys, symbol, th=ext_th):
                 exit_signal = TradeSignal(
-                    id=self.ID, symbol=symbol, action=TradeAction.EXIT_LONG
+                    id=strategy_id, symbol=symbol, action=TradeAction.EXIT_LONG
                 )
-            elif (
-                self.exit_positions(1, sells, symbol, th=self.ext_th)
-                or score >= self.threshold
-            ):
+            elif is_long or self.exit_positions(1, sells, symbol, th=ext_th):
                 exit_signal = TradeSignal(
-                    id=self.ID, symbol=symbol, action=TradeAction.EXIT_SHORT
+                    id=strategy_id, symbol=symbol, action=TradeAction.EXIT_SHORT
                 )
 
             if exit_signal is not None:
                 signals.append(exit_signal)
 
             # Generate LONG signal
-            if score >= self.threshold and not self._ismax_postions():
+            if is_long and open_positions + new_positions < max_positions:
                 if len(buys) == 0:
                     self.logger.debug(
-                        f"Ticker: {ticker}, Symbol: {symbol}, Sentiment: {score}"
+                        "Ticker: {}, Symbol: {}, Sentiment: {}", ticker, symbol, score
                     )
                     signal = TradeSignal(
-                        id=self.ID, symbol=symbol, action=TradeAction.LONG
+                        id=strategy_id, symbol=symbol, action=TradeAction.LONG
                     )
                     signals.append(signal)
-                elif len(buys) in range(1, self.max_trades[symbol] + 1):
-                    current_price = self.account.get_tick_info(symbol).ask
+                    new_positions += 1
+                elif 1 <= len(buys) <= max_trades:
                     if (
-                        self.calculate_pct_change(current_price, min(buys))
-                        <= -self.ext_th / 2
+                        self.calculate_pct_change(
+                            account.get_tick_info(symbol).ask, min(buys)
+                        )
+                        <= -half_ext_th
                     ):
                         self.logger.debug(
-                            f"Ticker: {ticker}, Symbol: {symbol}, Sentiment: {score}"
+                            "Ticker: {}, Symbol: {}, Sentiment: {}",
+                            ticker,
+                            symbol,
+                            score,
                         )
                         signal = TradeSignal(
-                            id=self.ID, symbol=symbol, action=TradeAction.LONG
+                            id=strategy_id, symbol=symbol, action=TradeAction.LONG
                         )
                         signals.append(signal)
+                        new_positions += 1
 
             # Generate SHORT signal
-            if score <= -self.threshold / 2 and not self._ismax_postions():
+            if is_short and open_positions + new_positions < max_positions:
                 if len(sells) == 0:
                     self.logger.debug(
-                        f"Ticker: {ticker}, Symbol: {symbol}, Sentiment: {score}"
+                        "Ticker: {}, Symbol: {}, Sentiment: {}", ticker, symbol, score
                     )
                     signal = TradeSignal(
-                        id=self.ID, symbol=symbol, action=TradeAction.SHORT
+                        id=strategy_id, symbol=symbol, action=TradeAction.SHORT
                     )
                     signals.append(signal)
-                elif len(sells) in range(1, self.max_trades + 1):
+                    new_positions += 1
+                elif 1 <= len(sells) <= max_trades:
                     if (
-                        self.calculate_pct_change(current_price, max(sells))
-                        >= self.ext_th / 2
+                        self.calculate_pct_change(
+                            account.get_tick_info(symbol).bid, max(sells)
+                        )
+                        >= half_ext_th
                     ):
                         self.logger.debug(
-                            f"Ticker: {ticker}, Symbol: {symbol}, Sentiment: {score}"
+                            "Ticker: {}, Symbol: {}, Sentiment: {}",
+                            ticker,
+                            symbol,
+                            score,
                         )
                         signal = TradeSignal(
-                            id=self.ID, symbol=symbol, action=TradeAction.SHORT
+                            id=strategy_id, symbol=symbol, action=TradeAction.SHORT
                         )
                         signals.append(signal)
+                        new_positions += 1
 
         return signals
 